@@ -11,6 +11,10 @@ import tkinter as tk
 from tkinter import ttk
 from PIL import ImageTk
 
+# The number of landmark items created up front for each canvas is the maximum
+# number of landmarks the model accepts per canvas.
+from .model import MAX_LANDMARKS
+
 
 class ScrollableFrame(ttk.Frame):
     """
@@ -22,25 +26,37 @@ class ScrollableFrame(ttk.Frame):
     def __init__(self, container, *args, **kwargs):
         super().__init__(container, *args, **kwargs)
         # The canvas widget will contain the content and be controlled by the scrollbar.
-        canvas = tk.Canvas(self)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
+        self.canvas = tk.Canvas(self)
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         # This is the actual frame where other widgets will be placed.
-        self.scrollable_frame = ttk.Frame(canvas)
+        self.scrollable_frame = ttk.Frame(self.canvas)
 
         # This binding is key: when the size of the inner frame changes,
         # it tells the canvas to update its scrollable region.
-        self.scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._update_scrollregion)
 
         # Place the scrollable frame inside the canvas.
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        self.canvas.configure(yscrollcommand=scrollbar.set)
 
         # Use the pack geometry manager to arrange the canvas and scrollbar.
-        canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+    def _update_scrollregion(self, event):
+        """Resizes the scrollable region to match the inner frame."""
+        # The inner frame is the only item on the canvas, so its requested size
+        # is the scrollable region. Reading it is much cheaper than asking the
+        # canvas to walk all of its items with bbox("all") on every resize.
+        self.canvas.configure(
+            scrollregion=(
+                0,
+                0,
+                self.scrollable_frame.winfo_reqwidth(),
+                self.scrollable_frame.winfo_reqheight(),
+            )
+        )
+
 
 class App(tk.Frame):
     """
@@ -73,11 +89,21 @@ class App(tk.Frame):
 
         self.controller = None
         self.last_status = "Load a CSV file and an image to begin."
+        # Mouse coordinates waiting to be shown in the status bar, and whether
+        # an idle callback has already been scheduled to show them.
+        self._pending_coord = None
+        self._coord_scheduled = False
+        # Pools of canvas items for the landmarks: canvas -> [(oval, text), ...],
+        # where entry i draws landmark number i + 1. The items are created once
+        # (hidden) and then only moved, shown and hidden, never recreated.
+        self._landmark_items = {}
 
         # The setup is broken into logical parts for clarity.
         self._create_widgets()
         self._create_layout()
         self._bind_events()
+        self._create_landmark_pool(self.image_canvas)
+        self._create_landmark_pool(self.csv_canvas)
 
     def _create_widgets(self):
         """Creates all the individual GUI widgets."""
@@ -130,6 +156,22 @@ class App(tk.Frame):
         self.csv_landmarks_frame = ttk.LabelFrame(
             csv_scroll_container.scrollable_frame, text="CSV Landmarks"
         )
+        # Each list is a single read-only Text widget. Rewriting its contents is
+        # much cheaper than creating and destroying one Label per landmark.
+        # They are tall enough for every landmark, one per line, so the whole
+        # list is reached with the scrollbar of the ScrollableFrame around it.
+        self.image_landmarks_text = tk.Text(
+            self.image_landmarks_frame,
+            width=30,
+            height=MAX_LANDMARKS,
+            state="disabled",
+        )
+        self.csv_landmarks_text = tk.Text(
+            self.csv_landmarks_frame,
+            width=30,
+            height=MAX_LANDMARKS,
+            state="disabled",
+        )
 
         # --- Bottom Controls ---
         self.undo_button = ttk.Button(
@@ -162,6 +204,8 @@ class App(tk.Frame):
         # Pack the landmark list containers.
         self.image_landmarks_frame.pack(fill="both", expand=True)
         self.csv_landmarks_frame.pack(fill="both", expand=True)
+        self.image_landmarks_text.pack(fill="both", expand=True)
+        self.csv_landmarks_text.pack(fill="both", expand=True)
         self.image_landmarks_frame.master.master.pack(
             side="left", fill="x", expand=True, padx=(0, 5)
         )
@@ -197,11 +241,26 @@ class App(tk.Frame):
 
     def _track_coords(self, event, canvas_name):
         """Displays the current mouse coordinates on the status bar."""
-        coord_text = f"{canvas_name} Coords: ({event.x}, {event.y})"
-        self.status_bar.config(text=coord_text)
+        # <Motion> fires for every pixel the mouse moves. Only the latest
+        # position is kept, and the status bar is updated once per idle cycle.
+        self._pending_coord = (canvas_name, event.x, event.y)
+        if not self._coord_scheduled:
+            self._coord_scheduled = True
+            self.master.after_idle(self._flush_coords)
+
+    def _flush_coords(self):
+        """Shows the most recent pending mouse coordinates on the status bar."""
+        self._coord_scheduled = False
+        if self._pending_coord is None:
+            return
+        canvas_name, x, y = self._pending_coord
+        self._pending_coord = None
+        self.status_bar.config(text=f"{canvas_name} Coords: ({x}, {y})")
 
     def _reset_status(self, event):
         """Resets the status bar to its last persistent message."""
+        # Drop any coordinates still waiting so they don't overwrite the reset.
+        self._pending_coord = None
         self.status_bar.config(text=self.last_status)
 
     def display_image(self, img_tk):
@@ -221,6 +280,9 @@ class App(tk.Frame):
         # This is a tkinter quirk: we must keep a reference to the image
         # to prevent it from being garbage collected.
         self.image_canvas.image = img_tk
+        # Deleting everything also removed the landmark items, so recreate
+        # them on top of the new image.
+        self._create_landmark_pool(self.image_canvas)
 
     def display_csv_as_image(self, img_tk):
         """
@@ -235,6 +297,40 @@ class App(tk.Frame):
             25, 25, 25 + img_tk.width(), 25 + img_tk.height(), outline="black"
         )
         self.csv_canvas.image = img_tk  # Keep a reference
+        self._create_landmark_pool(self.csv_canvas)
+
+    def _create_landmark_pool(self, canvas, size=MAX_LANDMARKS):
+        """
+        Creates the hidden canvas items used to draw landmarks on a canvas.
+
+        Args:
+            canvas (tk.Canvas): The canvas to create the items on.
+            size (int, optional): How many landmarks the pool can draw.
+                                  Defaults to MAX_LANDMARKS.
+        """
+        self._landmark_items[canvas] = []
+        for _ in range(size):
+            self._add_landmark_item(canvas)
+
+    def _add_landmark_item(self, canvas):
+        """Adds one hidden oval and number label to a canvas's landmark pool."""
+        items = self._landmark_items[canvas]
+        number = len(items) + 1
+        tag = f"landmark_{number}"
+        # The colored circle.
+        oval_id = canvas.create_oval(
+            0, 0, 0, 0, outline="black", state="hidden", tags=(tag, "landmark")
+        )
+        # The landmark number in the center of the circle.
+        text_id = canvas.create_text(
+            0,
+            0,
+            text=str(number),
+            fill="white",
+            state="hidden",
+            tags=(tag, "landmark"),
+        )
+        items.append((oval_id, text_id))
 
     def draw_landmark(self, canvas, x, y, number, color="red"):
         """
@@ -247,13 +343,46 @@ class App(tk.Frame):
             number (int): The landmark number to display.
             color (str, optional): The color of the landmark circle. Defaults to "red".
         """
-        tag = f"landmark_{number}"
-        # Draw the colored circle.
-        canvas.create_oval(
-            x - 5, y - 5, x + 5, y + 5, fill=color, outline="black", tags=(tag, "landmark")
-        )
-        # Draw the landmark number in the center of the circle.
-        canvas.create_text(x, y, text=str(number), fill="white", tags=(tag, "landmark"))
+        items = self._landmark_items[canvas]
+        while len(items) < number:
+            self._add_landmark_item(canvas)
+        oval_id, text_id = items[number - 1]
+        canvas.coords(oval_id, x - 5, y - 5, x + 5, y + 5)
+        canvas.itemconfigure(oval_id, fill=color, state="normal")
+        canvas.coords(text_id, x, y)
+        canvas.itemconfigure(text_id, state="normal")
+
+    def set_landmarks(self, canvas, points, color="red"):
+        """
+        Shows exactly the given landmarks on a canvas, numbered from 1.
+
+        Pooled items are moved into place for each point, and the rest of the
+        pool is hidden.
+
+        Args:
+            canvas (tk.Canvas): The canvas to draw on.
+            points (list): The (x, y) canvas coordinates of the landmarks.
+            color (str, optional): The color of the landmark circles. Defaults to "red".
+        """
+        for i, (x, y) in enumerate(points):
+            self.draw_landmark(canvas, x, y, i + 1, color=color)
+        self.trim_landmarks(canvas, len(points))
+
+    def trim_landmarks(self, canvas, count):
+        """
+        Hides the drawings of all landmarks numbered above `count` on a canvas.
+
+        Args:
+            canvas (tk.Canvas): The canvas to hide landmarks on.
+            count (int): The number of landmarks to keep.
+        """
+        # Each Tk call goes through the interpreter, so items are hidden by tag:
+        # one call for the whole pool, or one per landmark (oval and number).
+        if count == 0:
+            canvas.itemconfigure("landmark", state="hidden")
+            return
+        for number in range(count + 1, len(self._landmark_items[canvas]) + 1):
+            canvas.itemconfigure(f"landmark_{number}", state="hidden")
 
     def update_landmark_lists(self, landmarks_csv, landmarks_image):
         """
@@ -263,25 +392,24 @@ class App(tk.Frame):
             landmarks_csv (list): A list of (x, y) tuples for the CSV landmarks.
             landmarks_image (list): A list of (x, y) tuples for the image landmarks.
         """
-        # Clear the previous list content.
-        for widget in self.csv_landmarks_frame.winfo_children():
-            widget.destroy()
-        for widget in self.image_landmarks_frame.winfo_children():
-            widget.destroy()
-
-        # Add a label for each landmark.
-        for i, (x, y) in enumerate(landmarks_image):
-            img_text = f"#{i+1}: ({x:.1f}, {y:.1f})"
-            ttk.Label(self.image_landmarks_frame, text=img_text).pack(anchor="w")
+        self._set_landmark_text(self.image_landmarks_text, landmarks_image)
+        self._set_landmark_text(self.csv_landmarks_text, landmarks_csv)
 
-        for i, (x, y) in enumerate(landmarks_csv):
-            csv_text = f"#{i+1}: ({x:.1f}, {y:.1f})"
-            ttk.Label(self.csv_landmarks_frame, text=csv_text).pack(anchor="w")
+    def _set_landmark_text(self, text_widget, landmarks):
+        """Replaces the contents of a landmark list with one line per landmark."""
+        text = "\n".join(
+            f"#{i+1}: ({x:.1f}, {y:.1f})" for i, (x, y) in enumerate(landmarks)
+        )
+        # The widget is kept read-only, so it is unlocked just for the rewrite.
+        text_widget.config(state="normal")
+        text_widget.delete("1.0", "end")
+        text_widget.insert("1.0", text)
+        text_widget.config(state="disabled")
 
     def clear_landmarks(self):
         """Removes all landmark drawings from the canvases."""
-        self.image_canvas.delete("landmark")
-        self.csv_canvas.delete("landmark")
+        self.trim_landmarks(self.image_canvas, 0)
+        self.trim_landmarks(self.csv_canvas, 0)
         self.update_landmark_lists([], [])
 
     def show_results_window(self, results, overlay_image):
@@ -296,7 +424,7 @@ class App(tk.Frame):
         results_window.title("Calibration Results")
 
         # --- Display the Overlay Image ---
-        img_tk = ImageTk.PhotoImage(overlay_image)
+        img_tk = ImageTk.PhotoImage(overlay_image, master=results_window)
         canvas = tk.Canvas(results_window, width=img_tk.width(), height=img_tk.height())
         canvas.create_image(0, 0, anchor="nw", image=img_tk)
         canvas.image = img_tk  # Keep a reference
@@ -307,11 +435,9 @@ class App(tk.Frame):
         stats_frame.pack(pady=10, padx=10, fill="x")
 
         # Format the affine matrix for display.
-        matrix_str = (
-            "Aff-Matrix:\n"
-            + f"[{results['affine_matrix'][0][0]:.4f}, {results['affine_matrix'][0][1]:.4f}, {results['affine_matrix'][0][2]:.4f}]\n"
-            + f"[{results['affine_matrix'][1][0]:.4f}, {results['affine_matrix'][1][1]:.4f}, {results['affine_matrix'][1][2]:.4f}]\n"
-            + f"[{results['affine_matrix'][2][0]:.4f}, {results['affine_matrix'][2][1]:.4f}, {results['affine_matrix'][2][2]:.4f}]"
+        matrix_str = "Aff-Matrix:\n" + "\n".join(
+            "[" + ", ".join(f"{value:.4f}" for value in row) + "]"
+            for row in results["affine_matrix"]
         )
 
         # Use a fixed-width font for the matrix to ensure alignment.
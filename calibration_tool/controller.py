@@ -7,16 +7,22 @@ logic hub. It responds to user actions from the View (e.g., button clicks),
 interacts with the Model to update the application's state, and calls on
 other modules (like `analysis.py` and `image.py`) to perform specialized tasks.
 """
-from tkinter import filedialog, messagebox
+from tkinter import messagebox
 from PIL import Image, ImageTk, ImageDraw
 import numpy as np
 import json
 from datetime import datetime
 import os
-import csv
 
-from .analysis import calculate_affine_transform
+# `tkinter.filedialog` is imported inside the methods that use it. It is only
+# needed when a file has to be picked, so the app window opens without
+# importing it (the paths usually come from the command line).
+
+from .analysis import AffineSolver
 from . import image
+# `points_csv` imports the csv module, but it isn't worth deferring: csv is
+# already imported at startup by SciPy (through numpy.testing).
+from . import points_csv
 
 # I have to add this because I use this script as a subprocess.
 import sys
@@ -56,6 +62,15 @@ class Controller:
         self.view = view
         # The experiment path is created in main.py and passed here.
         self.model.experiment_path = experiment_path
+        # The affine fit is updated incrementally as landmark pairs are completed
+        # or undone, instead of being rebuilt from every point on each calibration.
+        self.solver = AffineSolver()
+        # Reusable pixel buffer for the point cloud layer of the overlay image.
+        self._overlay_layer = None
+        # The white base canvas with the processed image pasted in, and the image
+        # it was built from, so it is only rebuilt when the image changes.
+        self._overlay_base = None
+        self._overlay_base_source = None
                 
         # Print it to send it to the other python process
         # We send it as a json object to keep it clean if we want other infos
@@ -92,6 +107,8 @@ class Controller:
         # If no path is provided (e.g., from a command-line argument),
         # open a standard file dialog for the user.
         if not path:
+            from tkinter import filedialog
+
             path = filedialog.askopenfilename(
                 filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg;*.jpeg")]
             )
@@ -107,13 +124,16 @@ class Controller:
             processed_image = self._preprocess_image(raw_image)
             # Store the processed image in the model.
             self.model.image = processed_image
-            # Convert the Pillow image to a format Tkinter can display.
-            self.model.image_tk = ImageTk.PhotoImage(self.model.image)
+            # Convert the Pillow image to a format Tkinter can display. The
+            # view is passed as master so the photo belongs to its Tk interpreter
+            # instead of whichever one Tk considers the default root.
+            self.model.image_tk = ImageTk.PhotoImage(self.model.image, master=self.view)
             # Tell the view to display the new image.
             self.view.display_image(self.model.image_tk)
             self.view.update_status(f"Loaded and processed Image: {path}")
             # When a new image is loaded, clear any old landmarks.
             self.model.clear_landmarks()
+            self._sync_solver()
             self._redraw_landmarks()
         except Exception as e:
             # Show a user-friendly error message if anything goes wrong.
@@ -128,6 +148,8 @@ class Controller:
                 dialog will be opened. Defaults to None.
         """
         if not path:
+            from tkinter import filedialog
+
             path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
         if not path:
             return
@@ -137,12 +159,13 @@ class Controller:
             # Preprocess the CSV data, which includes scaling and converting it to an image.
             processed_image = self._preprocess_csv()
             # Convert the resulting image to a Tkinter-compatible format.
-            self.model.csv_tk = ImageTk.PhotoImage(processed_image)
+            self.model.csv_tk = ImageTk.PhotoImage(processed_image, master=self.view)
             # Tell the view to display the CSV data visualization.
             self.view.display_csv_as_image(self.model.csv_tk)
             self.view.update_status(f"Loaded and processed CSV: {path}")
             # Clear any old landmarks.
             self.model.clear_landmarks()
+            self._sync_solver()
             self._redraw_landmarks()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load or process CSV file: {e}")
@@ -165,47 +188,95 @@ class Controller:
                     "Maximum number of image landmarks (12) reached."
                 )
                 return
+            canvas, color = self.view.image_canvas, "red"
+            number = len(self.model.landmarks_image)
         elif canvas_type == "csv":
             if not self.model.add_csv_landmark(point):
                 self.view.update_status("Maximum number of CSV landmarks (12) reached.")
                 return
+            canvas, color = self.view.csv_canvas, "green"
+            number = len(self.model.landmarks_csv)
+        else:
+            return
 
-        # After adding a point, update the display.
-        self._redraw_landmarks()
+        # A new point may complete a pair, so update the fit.
+        self._sync_solver()
+        # Only the new landmark needs drawing; the others are already on the canvas.
+        self.view.draw_landmark(canvas, event.x, event.y, number, color=color)
+        self.view.update_landmark_lists(
+            self.model.landmarks_csv, self.model.landmarks_image
+        )
         # Check if the "Calibrate" button should be enabled.
         self._update_calibrate_button_state()
 
     def undo_last_point(self):
         """Removes the most recently added landmark."""
+        if not self.model.action_history:
+            return
+        last_action = self.model.action_history[-1]
         # The model contains the logic for undoing the last action.
         self.model.undo_last_landmark()
-        # Redraw the canvases to reflect the change.
-        self._redraw_landmarks()
+        self._sync_solver()
+        # Only the undone landmark needs to disappear from its canvas.
+        if last_action == "image":
+            self.view.trim_landmarks(
+                self.view.image_canvas, len(self.model.landmarks_image)
+            )
+        else:
+            self.view.trim_landmarks(
+                self.view.csv_canvas, len(self.model.landmarks_csv)
+            )
+        self.view.update_landmark_lists(
+            self.model.landmarks_csv, self.model.landmarks_image
+        )
         self._update_calibrate_button_state()
 
     def _redraw_landmarks(self):
         """
-        Clears and redraws all landmarks on both canvases.
+        Redraws all landmarks on both canvases.
 
-        This ensures the display is always in sync with the model's state.
+        This ensures the display is always in sync with the model's state. It is
+        used when the whole landmark set changes (e.g. on loading a file); single
+        clicks and undos only update the affected landmark.
+        The view moves its pooled landmark items into place and hides the ones
+        that are not used (e.g. after an undo).
         """
-        self.view.clear_landmarks()
-        # Draw the image landmarks in red.
-        for i, (x, y) in enumerate(self.model.landmarks_image):
-            # Add the padding back for drawing on the canvas.
-            self.view.draw_landmark(
-                self.view.image_canvas, x + img_padding, y + img_padding, i + 1, color="red"
-            )
+        # Draw the image landmarks in red, adding the padding back for drawing
+        # on the canvas.
+        self.view.set_landmarks(
+            self.view.image_canvas,
+            [(x + img_padding, y + img_padding) for x, y in self.model.landmarks_image],
+            color="red",
+        )
         # Draw the CSV landmarks in green.
-        for i, (x, y) in enumerate(self.model.landmarks_csv):
-            self.view.draw_landmark(
-                self.view.csv_canvas, x + img_padding, y + img_padding, i + 1, color="green"
-            )
+        self.view.set_landmarks(
+            self.view.csv_canvas,
+            [(x + img_padding, y + img_padding) for x, y in self.model.landmarks_csv],
+            color="green",
+        )
         # Update the text lists of landmarks in the side panel.
         self.view.update_landmark_lists(
             self.model.landmarks_csv, self.model.landmarks_image
         )
 
+    def _sync_solver(self):
+        """
+        Brings the incremental affine solver in line with the model's landmark pairs.
+
+        Pairs are formed by index, and landmarks are only ever appended, undone
+        from the end, or cleared. So the solver only ever needs to drop its
+        last pairs or add the newly completed ones.
+        """
+        num_pairs = min(len(self.model.landmarks_image), len(self.model.landmarks_csv))
+        while len(self.solver) > num_pairs:
+            self.solver.remove_point()
+        while len(self.solver) < num_pairs:
+            i = len(self.solver)
+            # We are mapping CSV points TO image points.
+            self.solver.add_point(
+                self.model.landmarks_csv[i], self.model.landmarks_image[i]
+            )
+
     def _update_calibrate_button_state(self):
         """
         Enables or disables the 'Calibrate' button based on the number of landmark pairs.
@@ -232,15 +303,24 @@ class Controller:
             return
 
         try:
-            # Call the analysis function to calculate the transformation.
+            # Solve the incrementally maintained fit for the transformation.
             # Note the order: we are mapping CSV points TO image points.
-            results = calculate_affine_transform(csv_points, image_points)
+            results = self.solver.solve()
             # Store the results dictionary in the model.
             self.model.calibration_results = results
+            # The affine matrix is 3x3, but for transforming 2D points, we only need
+            # the 2x3 part. It is extracted once here and reused by every transform.
+            self.model.affine_matrix_2x3 = np.asarray(
+                results["affine_matrix"], dtype=np.float64
+            )[:2, :]
+            # The transformed CSV points belong to the previous results.
+            self.model.transformed_csv_data = None
 
             self._calibrate_anchors(self.x_min, self.y_min, self.scale)
             # Generate the visual overlay to show the accuracy of the fit.
+            # It is kept on the model so save_results doesn't have to render it again.
             overlay_image = self._create_overlay_image()
+            self.model.overlay_image = overlay_image
             # Tell the view to open the results window.
             self.view.show_results_window(results, overlay_image)
 
@@ -262,25 +342,18 @@ class Controller:
 
         anchors = data["anchors"]
 
-        # --- Convert anchors to array and pad for affine transform ---
+        # --- Convert anchors to array for affine transform ---
         # Keep only x, y for transform
         anchor_names = list(anchors.keys())
         anchor_points = np.array([[v[0], v[1]] for v in anchors.values()])
 
-        # The affine matrix is 3x3, but for transforming 2D points, we only need the 2x3 part.
-        affine_matrix_2x3 = np.array(self.model.calibration_results["affine_matrix"])[
-            :2, :
-        ]
+        affine_matrix_2x3 = self.model.affine_matrix_2x3
         anchor_scaled_points = (anchor_points - [x_min, y_min]) * scale
-        # Add a column of ones to apply affine transform
-        anchor_points_padded = np.hstack([
-            anchor_scaled_points, 
-            np.ones((anchor_scaled_points.shape[0], 1))
-        ])
 
         # --- Apply affine transform ---
-        # affine_matrix_2x3 is shape (2, 3)
-        transformed_xy = np.dot(anchor_points_padded, affine_matrix_2x3.T)
+        # affine_matrix_2x3 is shape (2, 3): a linear part plus a translation.
+        transformed_xy = anchor_scaled_points @ affine_matrix_2x3[:, :2].T
+        transformed_xy += affine_matrix_2x3[:, 2]
 
         # --- Rebuild JSON with transformed x, y but same z ---
         new_anchors = {}
@@ -293,6 +366,71 @@ class Controller:
         with open(new_json_path, "w") as new_file:
             json.dump({"anchors": new_anchors}, new_file, indent=2)
 
+    def _get_all_transformed_points(self):
+        """
+        Returns all scaled CSV points mapped into image space by the calibration.
+
+        The result is computed once per calibration and cached on the model,
+        because both the overlay image and the saved CSV need it.
+
+        Returns:
+            np.ndarray: The (N, 2) array of transformed points.
+        """
+        if self.model.transformed_csv_data is None:
+            affine_matrix_2x3 = self.model.affine_matrix_2x3
+            # Apply the transformation as a linear part plus a translation.
+            # This gives the same result as multiplying coordinates padded with
+            # a column of ones, without allocating that padded copy of the
+            # whole point cloud. The points stay in float64 because they are
+            # also written to the calibrated CSV, not only drawn.
+            transformed = self.model.scaled_csv_data @ affine_matrix_2x3[:, :2].T
+            transformed += affine_matrix_2x3[:, 2]
+            self.model.transformed_csv_data = transformed
+        return self.model.transformed_csv_data
+
+    def _get_overlay_layer(self):
+        """
+        Returns the cleared, reusable RGBA array for the overlay's point cloud.
+
+        It is allocated once per canvas size. A freshly allocated canvas-sized
+        array has to be faulted in page by page by the first writes to it, which
+        costs more than clearing this one. Pillow still copies it once, when the
+        landmark markers are drawn on top of it.
+
+        Returns:
+            np.ndarray: The (H, W, 4) uint8 array, filled with zeros.
+        """
+        shape = (self.view.canvas_size, self.view.canvas_size, 4)
+        if self._overlay_layer is None or self._overlay_layer.shape != shape:
+            self._overlay_layer = np.empty(shape, dtype=np.uint8)
+        self._overlay_layer.fill(0)
+        return self._overlay_layer
+
+    def _get_overlay_base(self):
+        """
+        Returns the white canvas with the processed image pasted onto it.
+
+        It only depends on the processed image and the canvas size, so it is
+        built once and reused until either of them changes. The image object
+        itself is kept (not its id), so a new image can't match it by reusing
+        the memory of a freed one.
+
+        Returns:
+            PIL.Image.Image: The cached base canvas. Callers must not draw on it.
+        """
+        canvas_size = self.view.canvas_size
+        if (
+            self._overlay_base is None
+            or self._overlay_base_source is not self.model.image
+            or self._overlay_base.size != (canvas_size, canvas_size)
+        ):
+            self._overlay_base = Image.new(
+                "RGBA", (canvas_size, canvas_size), (255, 255, 255, 255)
+            )
+            self._overlay_base.paste(self.model.image, (0, 0))
+            self._overlay_base_source = self.model.image
+        return self._overlay_base
+
     def _create_overlay_image(self):
         """
         Generates an image that visually represents the calibration result.
@@ -304,76 +442,64 @@ class Controller:
         Returns:
             PIL.Image.Image: The composite overlay image.
         """
-        # Create a blank white canvas to draw on.
-        base_image = Image.new(
-            "RGBA", (self.view.canvas_size, self.view.canvas_size), (255, 255, 255, 255)
-        )
-        # Paste the processed image onto the canvas.
-        base_image.paste(self.model.image, (0, 0))
-
-        # Create a transparent layer for drawing the overlay graphics.
-        overlay = Image.new("RGBA", base_image.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
+        # Get a transparent layer for drawing the overlay graphics.
+        # It starts as a NumPy array so the point cloud can be stamped in one pass.
+        overlay_arr = self._get_overlay_layer()
 
         image_points, csv_points = self.model.get_landmark_pairs()
-        # The affine matrix is 3x3, but for transforming 2D points, we only need the 2x3 part.
-        affine_matrix_2x3 = np.array(self.model.calibration_results["affine_matrix"])[ 
-            :2, :
-        ]
+        affine_matrix_2x3 = self.model.affine_matrix_2x3
 
         # --- Visualization Part 1: Transform ALL CSV points ---
         # This shows how the entire CSV point cloud maps onto the image space.
         if self.model.scaled_csv_data is not None:
-            # Augment the coordinates with a column of ones for matrix multiplication.
-            all_csv_points_padded = np.hstack(
-                [
-                    self.model.scaled_csv_data,
-                    np.ones((self.model.scaled_csv_data.shape[0], 1)),
-                ]
+            all_transformed_points = self._get_all_transformed_points()
+            # Draw every transformed point as a small, semi-transparent blue dot.
+            image.draw_disks(
+                overlay_arr, all_transformed_points, radius=2, color=(0, 0, 255, 100)
             )
-            # Apply the transformation. The result is a new set of 2D coordinates.
-            all_transformed_points = np.dot(all_csv_points_padded, affine_matrix_2x3.T)
-            # Draw each transformed point as a small, semi-transparent blue dot.
-            for p in all_transformed_points:
-                draw.ellipse(
-                    (p[0] - 2, p[1] - 2, p[0] + 2, p[1] + 2),
-                    fill=(0, 0, 255, 100),
-                )
 
-        # --- Visualization Part 2: Highlight the user-selected landmark pairs ---
-        csv_points_padded = np.hstack([csv_points, np.ones((csv_points.shape[0], 1))])
-        transformed_landmark_points = np.dot(csv_points_padded, affine_matrix_2x3.T)
+        # Pillow wraps the array read-only and makes its own copy when the markers
+        # are drawn, so later renders can reuse the array freely.
+        overlay = Image.fromarray(overlay_arr, mode="RGBA")
+        draw = ImageDraw.Draw(overlay)
 
-        for i in range(len(image_points)):
+        # --- Visualization Part 2: Highlight the user-selected landmark pairs ---
+        # Same linear part plus translation as the point cloud above.
+        transformed_landmark_points = csv_points @ affine_matrix_2x3[:, :2].T
+        transformed_landmark_points += affine_matrix_2x3[:, 2]
+
+        # All marker coordinates are computed up front with array operations, so
+        # the drawing loop only hands ready-made coordinate lists to Pillow.
+        # They are not rounded: Pillow places ellipses with sub-pixel precision.
+        targets = image_points
+        centers = transformed_landmark_points
+        # Horizontal and vertical strokes of the red crosses around each target.
+        h_lines = np.column_stack(
+            [targets[:, 0] - 5, targets[:, 1], targets[:, 0] + 5, targets[:, 1]]
+        ).tolist()
+        v_lines = np.column_stack(
+            [targets[:, 0], targets[:, 1] - 5, targets[:, 0], targets[:, 1] + 5]
+        ).tolist()
+        # Bounding boxes of the blue circles around each transformed CSV landmark.
+        circle_boxes = np.column_stack(
+            [centers[:, 0] - 4, centers[:, 1] - 4, centers[:, 0] + 4, centers[:, 1] + 4]
+        ).tolist()
+
+        for h_line, v_line, circle_box in zip(h_lines, v_lines, circle_boxes):
             # Draw the target image landmark as a red cross. This is the "ground truth".
-            p_target = image_points[i]
-            draw.line(
-                (p_target[0] - 5, p_target[1], p_target[0] + 5, p_target[1]),
-                fill="red",
-                width=2,
-            )
-            draw.line(
-                (p_target[0], p_target[1] - 5, p_target[0], p_target[1] + 5),
-                fill="red",
-                width=2,
-            )
+            draw.line(h_line, fill="red", width=2)
+            draw.line(v_line, fill="red", width=2)
 
             # Draw the corresponding CSV landmark after transformation as a blue circle.
             # The distance between this circle and the red cross is the error for that pair.
-            p_transformed = transformed_landmark_points[i]
-            draw.ellipse(
-                (
-                    p_transformed[0] - 4,
-                    p_transformed[1] - 4,
-                    p_transformed[0] + 4,
-                    p_transformed[1] + 4,
-                ),
-                fill="darkblue",
-                outline="black",
-            )
+            draw.ellipse(circle_box, fill="darkblue", outline="black")
 
-        # Combine the base image with the drawing layer.
-        return Image.alpha_composite(base_image, overlay)
+        # Combine the cached base canvas with the drawing layer. alpha_composite
+        # writes the result to a new image, so the cache is never modified and
+        # doesn't need to be copied first. Blending the whole canvas in one call
+        # is also cheaper than copying the base and blending only the bounding
+        # box of the overlay, which Pillow does with an extra crop and paste.
+        return Image.alpha_composite(self._get_overlay_base(), overlay)
 
     def save_results(self):
         """
@@ -411,17 +537,24 @@ class Controller:
                     "canvas_size": int(self.view.canvas_size),
                     "img_padding": int(img_padding),
                 }
-            # JSON cannot handle NumPy arrays, so we convert the matrix to a standard list.
+            # JSON cannot handle NumPy arrays, so we convert the matrix and the
+            # per-pair errors to standard lists.
             data_to_save["calibration_results"]["affine_matrix"] = data_to_save[
                 "calibration_results"
             ]["affine_matrix"].tolist()
+            data_to_save["calibration_results"]["errors"] = data_to_save[
+                "calibration_results"
+            ]["errors"].tolist()
 
             # Write the dictionary to a JSON file with nice formatting.
             with open(json_path, "w") as f:
                 json.dump(data_to_save, f, indent=4)
 
-            # Generate and save the overlay image.
-            overlay_image = self._create_overlay_image()
+            # Save the overlay image, reusing the one shown after calibration
+            # unless the landmarks have changed since.
+            overlay_image = self.model.overlay_image
+            if overlay_image is None:
+                overlay_image = self._create_overlay_image()
             overlay_image.save(overlay_path)
 
             self.view.update_status(f"Results saved to {self.model.experiment_path}")
@@ -431,28 +564,15 @@ class Controller:
             )
 
 
-            csv_points_padded = np.hstack([self.model.scaled_csv_data, np.ones((self.model.scaled_csv_data.shape[0], 1))])
-            affine_matrix_2x3 = np.array(self.model.calibration_results["affine_matrix"])[:2, :]
-            all_transformed_points = np.dot(csv_points_padded, affine_matrix_2x3.T)
-            # CSV
-            # Load original CSV data again (all columns)
-            with open(self.model.csv_path, newline='', encoding='utf-8') as infile:
-                reader = csv.DictReader(infile)
-                fieldnames = reader.fieldnames
-
-                data_rows = list(reader)
-
-            # Attach results back to rows (keep row order)
-            for row, transformed in zip(data_rows, all_transformed_points):
-                row["x_transformed"] = transformed[0]  # first column
-                row["y_transformed"] = transformed[1]  # second column
-
-            # Write out new CSV with added columns
+            # Write out the original CSV rows (all columns, parsed at load time)
+            # with the transformed coordinates added.
             calibrated_path = os.path.join(self.model.experiment_path, "calibrated_points.csv")
-            with open(calibrated_path, "w", newline='', encoding='utf-8') as outfile:
-                writer = csv.DictWriter(outfile, fieldnames=fieldnames + ["x_transformed", "y_transformed"])
-                writer.writeheader()
-                writer.writerows(data_rows)
+            points_csv.write_calibrated_csv(
+                calibrated_path,
+                self.model.csv_fieldnames,
+                self.model.csv_rows,
+                self._get_all_transformed_points(),
+            )
 
             self.view.update_status(f"Calibrated points saved to {calibrated_path}")
             messagebox.showinfo("Success", f"Updated CSV saved to:\n{calibrated_path}")
@@ -474,21 +594,17 @@ class Controller:
             PIL.Image.Image: An image representing the scaled CSV points.
         """
 
-        # Load CSV data
-        with open(self.model.csv_path, newline='', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            fieldnames = reader.fieldnames
-
-            data_rows = list(reader)
-
-        # Convert to NumPy array of just x_pos and y_pos
-        raw_data = np.array([
-            [float(row["pos_x"]), float(row["pos_y"])]
-            for row in data_rows
-        ])
+        # Load CSV data. The file is read only once: its rows are kept on the
+        # model so save_results can write them back without parsing it again.
+        fieldnames, data_rows, raw_data = points_csv.read_points_csv(
+            self.model.csv_path
+        )
+        self.model.csv_fieldnames = fieldnames
+        self.model.csv_rows = data_rows
 
         # --- Step 1: Scale the coordinates to fit the canvas ---
-        x_min, y_min = raw_data.min(axis=0)
+        data_min = raw_data.min(axis=0)
+        x_min, y_min = data_min
         x_max, y_max = raw_data.max(axis=0)
 
         # We want the data to fit within the canvas, leaving a 25px (per side) margin.
@@ -504,15 +620,27 @@ class Controller:
         self.scale = scale
 
         # Apply the scaling. We first shift the data so the minimum is at (0,0).
-        scaled_data = (raw_data - [x_min, y_min]) * scale
+        # raw_data isn't used afterwards, so it is shifted and scaled in place
+        # instead of allocating two temporary copies of it.
+        raw_data -= data_min
+        raw_data *= scale
+        scaled_data = raw_data
         # Store the scaled data in the model for later use in calibration.
         self.model.scaled_csv_data = scaled_data
+        self.model.transformed_csv_data = None
 
         # --- Step 2: Save the intermediate scaled data ---
         scaled_csv_path = os.path.join(
             self.model.experiment_path, "scaled_coordinates.csv"
         )
-        np.savetxt(scaled_csv_path, scaled_data, delimiter=",")
+        # This writes exactly what np.savetxt(..., delimiter=",") would, but
+        # formats all rows with a single string operation instead of one
+        # Python-level format call per row.
+        with open(scaled_csv_path, "w") as f:
+            f.write(
+                ("%.18e,%.18e\n" * len(scaled_data))
+                % tuple(scaled_data.ravel().tolist())
+            )
 
         # --- Step 3: Generate an image from the scaled points ---
         img = self._create_image_from_coords(scaled_data, target_dim)
@@ -537,19 +665,14 @@ class Controller:
             PIL.Image.Image: A new image with the points drawn as black ellipses.
         """
         # Create a new white image.
-        img_size = (int(canvas_dim + 20), int(canvas_dim + 20))  # Add some padding
-        img = Image.new("L", img_size, "white")
-        draw = ImageDraw.Draw(img)
-
-        # Draw a small black ellipse for each coordinate.
-        for x, y in scaled_data:
-            draw.ellipse(
-                (x + 10 - 2, y + 10 - 2, x + 10 + 2, y + 10 + 2),
-                fill="black",
-                outline="black",
-            )
+        img_size = int(canvas_dim + 20)  # Add some padding
+        img = np.full((img_size, img_size), 255, dtype=np.uint8)
 
-        return img
+        # Draw a small black disk for each coordinate, shifted by the 10px padding.
+        # All points are stamped at once instead of one ellipse call per point.
+        image.draw_disks(img, scaled_data + 10, radius=2, color=0)
+
+        return Image.fromarray(img, mode="L")
 
     def _preprocess_image(self, raw_image):
         """
@@ -563,26 +686,37 @@ class Controller:
         Returns:
             PIL.Image.Image: The fully processed image.
         """
-        # --- Step 1: Initial crop to remove uniform borders ---
-        cropped_image_np = image.auto_crop(np.array(raw_image), borders=0)
-        cropped_image = Image.fromarray(cropped_image_np)
-
-        # --- Step 2: Scale the image to fit the canvas ---
-        width, height = cropped_image.size
+        # --- Step 1: Find the content, excluding uniform borders ---
+        # The pixels are only read, so a read-only np.asarray view is enough;
+        # np.array would make a second, writable copy of the whole image.
+        left, upper, right, lower = image.content_bbox(np.asarray(raw_image))
+
+        # --- Step 2: Crop and scale the image to fit the canvas ---
+        # Pillow can crop and resize in a single resampling pass via 'box'.
+        width, height = right - left, lower - upper
         target_dim = self.view.canvas_size - 50  # Leave a margin
         if width > 0 and height > 0:
             # Calculate the scale factor to fit the image, preserving aspect ratio.
             scale = min(target_dim / width, target_dim / height)
             new_size = (int(width * scale), int(height * scale))
             # Resize the image using a high-quality downsampling filter.
-            scaled_image = cropped_image.resize(new_size, Image.LANCZOS)
+            scaled_image = raw_image.resize(
+                new_size, Image.LANCZOS, box=(left, upper, right, lower)
+            )
         else:
-            scaled_image = cropped_image
-
-        # --- Step 3: Final crop with a border ---
-        # This ensures the object is nicely framed in the canvas.
-        final_image_np = image.auto_crop(np.array(scaled_image), borders=50)
-        final_image = Image.fromarray(final_image_np)
+            scaled_image = raw_image.crop((left, upper, right, lower))
+
+        # --- Step 3: Frame the content with a border ---
+        # This ensures the object is nicely framed in the canvas. The image is
+        # already cropped to its content, so instead of searching for it again
+        # we just add a 25px border of the background color on each side.
+        border = 25
+        final_image = Image.new(
+            "RGBA",
+            (scaled_image.width + 2 * border, scaled_image.height + 2 * border),
+            scaled_image.getpixel((0, 0)),
+        )
+        final_image.paste(scaled_image, (border, border))
 
         # --- Step 4: Save the processed image for reproducibility ---
         processed_image_path = os.path.join(
@@ -7,9 +7,16 @@ tool. They handle tasks such as removing backgrounds, cropping images to the
 content, resizing, and padding. The goal is to standardize the input images
 to ensure consistent and reliable calibration results.
 """
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
-from PIL import Image
-from skimage.segmentation import flood_fill
+from PIL import Image, ImageDraw
+from scipy import ndimage
+
+# The connectivity used to flood-fill the background: pixels are connected
+# horizontally and vertically. It is constant, so it is built only once.
+_CROSS_STRUCTURE = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=bool)
 
 
 def remove_background(img, threshold=10, init_pos=(0, 0), mode="fill"):
@@ -37,46 +44,45 @@ def remove_background(img, threshold=10, init_pos=(0, 0), mode="fill"):
             - np.ndarray: The black and white mask used, where white is the
                           foreground and black is the background.
     """
-    # Ensure the image is in a floating-point format for calculations.
-    img = img.astype(np.float32)
     # If the image already has an alpha channel, remove it for processing.
     if img.shape[-1] == 4:
         img = img[:, :, 0:3]
 
     # Get the color value of the background pixel.
-    value = img[init_pos]
-    # Calculate the Euclidean distance of every pixel's color from the background color.
-    # This creates a grayscale image where darker pixels are more similar to the background.
-    norm = np.linalg.norm(np.abs(img - value), axis=-1)
+    value = img[init_pos].astype(np.int32)
+    # Calculate the squared Euclidean distance of every pixel's color from the
+    # background color. Comparing squared distances against the squared threshold
+    # selects the same pixels as comparing the distances themselves, but takes a
+    # single integer pass (einsum sums the squares without more temporaries)
+    # instead of the abs, square, sum and sqrt passes of np.linalg.norm.
+    # int32 holds the largest possible value, 3 * 255**2, without overflowing.
+    diff = img.astype(np.int32)
+    diff -= value
+    sq_dist = np.einsum("ijk,ijk->ij", diff, diff)
 
     if mode == "fill":
-        # The 'footprint' defines the connectivity for the flood fill.
-        # This structure connects pixels horizontally and vertically.
-        binary_struct = np.zeros((3, 3))
-        binary_struct[0:3, 1] = 1
-        binary_struct[1, 0:3] = 1
-
-        # Perform the flood fill. It starts at init_pos and fills all pixels
-        # within the 'tolerance' with the value 999.
-        mask = flood_fill(
-            norm, init_pos, 999, footprint=binary_struct, tolerance=threshold
-        )
-        # Create the final mask: where the fill happened (999), make it transparent (0).
+        # Perform the flood fill: the filled region is the connected group of
+        # pixels within the threshold that contains init_pos (its distance is 0,
+        # so it always qualifies). Labelling the connected groups of the
+        # thresholded distances finds it in one C pass, which is faster than a
+        # general flood fill that compares every neighbor against a tolerance.
+        labels, _ = ndimage.label(sq_dist <= threshold**2, structure=_CROSS_STRUCTURE)
+        # Create the final mask: where the fill happened, make it transparent (0).
         # Everywhere else becomes opaque (255).
-        mask = np.where(mask == 999, 0, 255)
+        mask = np.where(labels == labels[init_pos], np.uint8(0), np.uint8(255))
     else:
         # A simpler method: any pixel with a color distance less than the
         # threshold is considered background (transparent).
-        mask = np.where(norm < threshold, 0, 255)
+        mask = np.where(sq_dist < threshold**2, np.uint8(0), np.uint8(255))
 
     # Create a new 4-channel (RGBA) image.
-    new_img = np.zeros(img.shape[0:2] + (4,)).astype(np.uint8)
+    new_img = np.empty(img.shape[0:2] + (4,), dtype=np.uint8)
     # Copy the original RGB data.
     new_img[:, :, 0:3] = img
     # Apply the generated mask to the alpha channel.
     new_img[:, :, 3] = mask
 
-    return new_img, mask.astype(np.uint8)
+    return new_img, mask
 
 
 def auto_crop(img, borders=0):
@@ -95,36 +101,65 @@ def auto_crop(img, borders=0):
     Returns:
         np.ndarray: The cropped image.
     """
+    if borders == 0:
+        # Without a border there is nothing to add around the image, so the
+        # content is found on the image itself and only the crop is copied.
+        left, upper, right, lower = content_bbox(img)
+        return img[upper:lower, left:right].copy()
+
     # This function first adds a temporary border to ensure the background
     # removal works correctly, especially if the object touches the edges.
+    # The border keeps all of the background connected around the object.
     value = img[0, 0]
+    half = borders // 2
     new_shape = (img.shape[0] + borders, img.shape[1] + borders, img.shape[2])
-    new_img = np.ones(new_shape, dtype=np.uint8) * value
-
-    # Place the original image in the center of this new, larger image.
-    new_img[
-        borders // 2 : borders // 2 + img.shape[0],
-        borders // 2 : borders // 2 + img.shape[1],
-        :,
-    ] = img
-    # Generate the foreground mask.
-    _, mask = remove_background(new_img)
-
-    # Find all non-background (opaque) pixels in the mask.
-    x, y = np.where(mask == 255)
-    # Determine the minimum and maximum coordinates to find the bounding box.
-    x_min, x_max = np.min(x), np.max(x)
-    y_min, y_max = np.min(y), np.max(y)
+    new_img = np.empty(new_shape, dtype=np.uint8)
+
+    # Place the original image in the center of this new, larger image, and
+    # fill only the border strips around it with the background color.
+    new_img[half : half + img.shape[0], half : half + img.shape[1], :] = img
+    new_img[:half] = value
+    new_img[half + img.shape[0] :] = value
+    new_img[half : half + img.shape[0], :half] = value
+    new_img[half : half + img.shape[0], half + img.shape[1] :] = value
+    # Find the bounding box of the content.
+    left, upper, right, lower = content_bbox(new_img)
     # Crop the image to this bounding box.
     cropped = new_img[
-        x_min - borders // 2 : x_max + borders // 2 + 1,
-        y_min - borders // 2 : y_max + borders // 2 + 1,
+        upper - half : lower + half,
+        left - half : right + half,
         :,
     ]
 
     return cropped
 
 
+def content_bbox(img):
+    """
+    Finds the bounding box of the main content of an image.
+
+    The content is everything that is not connected background, as detected
+    by `remove_background` from the top-left pixel.
+
+    Args:
+        img (np.ndarray): The input image as a NumPy array.
+
+    Returns:
+        tuple: The (left, upper, right, lower) box of the content, in the same
+               convention as Pillow's `Image.crop` (right and lower are exclusive).
+    """
+    # Generate the foreground mask.
+    _, mask = remove_background(img)
+
+    # Find the box around all non-background (opaque) pixels of the mask.
+    # Pillow's getbbox scans for non-zero pixels in a single C loop, instead
+    # of collecting the coordinates of every foreground pixel first.
+    bbox = Image.fromarray(mask).getbbox()
+    if bbox is None:
+        raise ValueError("The image has no content to crop to.")
+    return bbox
+
+
 def resize(img, ratio_frac=None, ratio_val=None, dimensions=None, scale=None):
     """
     Resizes an image using various methods.
@@ -193,14 +228,22 @@ def generate_mosaic(
     Returns:
         np.ndarray: The final mosaic image.
     """
-    sizes = np.zeros((len(imgs), 2))
-    for i, img in enumerate(imgs):
-        if auto_bbox:
-            imgs[i] = auto_crop(img)
+    # Every image is processed independently, and the heavy lifting happens in
+    # NumPy, SciPy and Pillow code that releases the GIL, so the images are
+    # processed in parallel threads. map keeps the results in input order.
+    def crop(img):
+        # The bordered crop is also cropped to the content, so when a border is
+        # requested the plain crop would be discarded: only one is computed.
         if auto_border:
             border = (img.shape[0] + img.shape[1]) // 20
-            imgs[i] = auto_crop(img, borders=border)
-        sizes[i] = imgs[i].shape[0:2]
+            return auto_crop(img, borders=border)
+        if auto_bbox:
+            return auto_crop(img)
+        return img
+
+    with ThreadPoolExecutor() as executor:
+        imgs[:] = executor.map(crop, imgs)
+    sizes = np.array([img.shape[0:2] for img in imgs], dtype=np.float64)
 
     # Compute the final size of each cell in the mosaic.
     ratio = sizes[:, 0] / sizes[:, 1]
@@ -209,38 +252,38 @@ def generate_mosaic(
     elif scaling_method == "resize_to_max" or scaling_method == "pad_to_max":
         final_size = np.max(sizes, axis=0).astype(np.uint16)
     avg_ratio = final_size[0] / final_size[1]
-    for i, img in enumerate(imgs):
-        # Preserve aspect ratio while fitting to the target cell size.
-        if ratio[i] > avg_ratio:
-            dim_1 = final_size[0]
-            dim_2 = dim_1 / ratio[i]
-        else:
-            dim_2 = final_size[1]
-            dim_1 = dim_2 * ratio[i]
-
+    # Preserve aspect ratio while fitting to the target cell size. The target
+    # dimensions of all images are computed at once: images that are taller
+    # than the cell are fitted to its height, the others to its width.
+    taller = ratio > avg_ratio
+    dims_1 = np.where(taller, final_size[0], final_size[1] * ratio)
+    dims_2 = np.where(taller, final_size[0] / ratio, final_size[1])
+
+    def fit(img, dim_1, dim_2):
         if scaling_method == "resize_to_avg" or scaling_method == "resize_to_max":
-            imgs[i] = np.asarray(resize(img, dimensions=(dim_2, dim_1)))
+            img = np.asarray(resize(img, dimensions=(dim_2, dim_1)))
         # Pad the image to make sure it's exactly the final_size.
-        imgs[i] = pad_image_to_center(imgs[i], final_size)
+        return pad_image_to_center(img, final_size)
 
-    # Create the blank canvas for the mosaic.
-    mosaic = np.zeros((int(final_size[0] * rows), int(final_size[1] * columns), 3))
+    with ThreadPoolExecutor() as executor:
+        imgs[:] = executor.map(fit, imgs, dims_1, dims_2)
 
-    # Place each processed image into its correct cell in the mosaic.
-    for i, img in enumerate(imgs):
-        if rows <= columns:
-            row = i % columns
-            col = i // columns
-        else:
-            row = i // rows
-            col = i % rows
-        mosaic[
-            col * final_size[0] : (col + 1) * final_size[0],
-            row * final_size[1] : (row + 1) * final_size[1],
-            :,
-        ] = img[:, :, 0:3]
+    # All tiles now have exactly the final_size, so they are stacked into one
+    # array (cells without an image stay black) and the grid is assembled with
+    # a single reshape/transpose copy instead of one slice assignment per tile.
+    height, width = int(final_size[0]), int(final_size[1])
+    tiles = np.zeros((rows * columns, height, width, 3), dtype=np.uint8)
+    np.stack([img[:, :, 0:3] for img in imgs], out=tiles[: len(imgs)])
 
-    return mosaic.astype(np.uint8)
+    if rows <= columns:
+        # Fill the grid row by row.
+        grid = tiles.reshape(rows, columns, height, width, 3).transpose(0, 2, 1, 3, 4)
+    else:
+        # Fill the grid column by column.
+        grid = tiles.reshape(columns, rows, height, width, 3).transpose(1, 2, 0, 3, 4)
+    mosaic = grid.reshape(rows * height, columns * width, 3)
+
+    return mosaic
 
 
 def pad_image_to_center(img, new_shape):
@@ -262,11 +305,9 @@ def pad_image_to_center(img, new_shape):
     if old_image_width > new_image_width or old_image_height > new_image_height:
         raise ValueError("New shape must be larger than old shape!")
 
-    # Create a new image filled with a solid color (black).
-    color = (0, 0, 0)
-    new_img = np.full(
-        (new_image_height, new_image_width, channels), color, dtype=np.uint8
-    )
+    # Create a new image filled with a solid color (black). np.zeros gets memory
+    # that is already zeroed, instead of broadcasting a fill color over it.
+    new_img = np.zeros((new_image_height, new_image_width, channels), dtype=np.uint8)
 
     # Calculate the top-left coordinate where the original image should be placed.
     x_center = (new_image_width - old_image_width) // 2
@@ -278,3 +319,108 @@ def pad_image_to_center(img, new_shape):
     ] = img
 
     return new_img
+
+
+@lru_cache(maxsize=None)
+def _ellipse_offsets(width, height):
+    """
+    Returns the pixels covered by a filled ellipse in a box of the given size.
+
+    The ellipse is rasterized once with Pillow, so stamping it with `draw_disks`
+    gives exactly the same pixels as `ImageDraw.ellipse` would.
+
+    Args:
+        width (int): The width of the ellipse's box, x1 - x0, in pixels.
+        height (int): The height of the ellipse's box, y1 - y0, in pixels.
+
+    Returns:
+        tuple: Two arrays with the (row, column) offsets from the box's
+               top-left corner.
+    """
+    glyph = Image.new("L", (width + 1, height + 1), 0)
+    ImageDraw.Draw(glyph).ellipse((0, 0, width, height), fill=255)
+    return np.nonzero(np.asarray(glyph))
+
+
+def draw_disks(img, centers, radius, color):
+    """
+    Draws a filled disk at each of many points in a single vectorized pass.
+
+    Instead of one drawing call per point, the pixels of all the disks are
+    marked at once with NumPy indexing, and the color is then written once to
+    every covered pixel. The result is the
+    same as calling `ImageDraw.ellipse` on the box (x - radius, y - radius,
+    x + radius, y + radius) of every point, including points near or outside
+    the image borders, where the disks are clipped.
+
+    Args:
+        img (np.ndarray): The image to draw on, modified in place. Either
+            (H, W) or (H, W, C).
+        centers (np.ndarray): An (N, 2) array of (x, y) disk centers.
+        radius (int): The radius of the disks in pixels.
+        color (int or tuple): The value written to the covered pixels.
+
+    Returns:
+        np.ndarray: The same image, for convenience.
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    # Pillow converts each coordinate of the box to an integer by truncating it
+    # toward zero. Near the top-left border (negative coordinates) this is not
+    # the same as flooring the center, and the box can even get smaller, so
+    # the box corners are truncated exactly the way Pillow does it.
+    x0 = np.trunc(centers[:, 0] - radius).astype(np.intp)
+    y0 = np.trunc(centers[:, 1] - radius).astype(np.intp)
+    x1 = np.trunc(centers[:, 0] + radius).astype(np.intp)
+    y1 = np.trunc(centers[:, 1] + radius).astype(np.intp)
+    box_widths = x1 - x0
+    box_heights = y1 - y0
+    if len(centers) == 0:
+        return img
+
+    height, width = img.shape[:2]
+    # The disks are first marked on a boolean mask of the covered pixels, then
+    # the color is written once to every covered pixel. Marking single bytes
+    # through flat indices is much cheaper than writing a multi-channel color
+    # to every disk pixel, and overlapping disks are only written once.
+    covered = np.zeros((height, width), dtype=bool)
+    covered_flat = covered.reshape(-1)
+
+    # Almost all points share the full box size. Points whose box was shrunk
+    # by the truncation are drawn in separate groups with their own footprint.
+    # Each box size is encoded as a single integer key, so the sizes present
+    # are found with one bincount instead of sorting every point's size.
+    n_heights = int(box_heights.max()) + 1
+    keys = box_widths * n_heights + box_heights
+    present_keys = np.flatnonzero(np.bincount(keys)).tolist()
+    for key in present_keys:
+        box_width, box_height = divmod(key, n_heights)
+        if len(present_keys) == 1:
+            group_x0, group_y0 = x0, y0
+        else:
+            group = keys == key
+            group_x0, group_y0 = x0[group], y0[group]
+        offsets_y, offsets_x = _ellipse_offsets(box_width, box_height)
+
+        # Disks whose whole box is inside the image need no clipping: all of
+        # their pixels are marked in a single pass, as flat indices.
+        inside = (
+            (group_x0 >= 0)
+            & (group_y0 >= 0)
+            & (group_x0 + box_width < width)
+            & (group_y0 + box_height < height)
+        )
+        corners = group_y0[inside] * width + group_x0[inside]
+        flat_offsets = offsets_y * width + offsets_x
+        covered_flat[(corners[:, None] + flat_offsets).ravel()] = True
+
+        # The few disks crossing or beyond a border are clipped pixel by pixel.
+        ys = (group_y0[~inside, None] + offsets_y).ravel()
+        xs = (group_x0[~inside, None] + offsets_x).ravel()
+        visible = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+        covered[ys[visible], xs[visible]] = True
+
+    # np.flatnonzero finds the covered pixels much faster than indexing the
+    # image with the 2-D boolean mask does.
+    rows, cols = np.divmod(np.flatnonzero(covered_flat), width)
+    img[rows, cols] = color
+    return img
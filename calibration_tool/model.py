@@ -10,6 +10,9 @@ when to update.
 """
 import numpy as np
 
+# We limit the number of landmarks per canvas to 12 to keep the UI clean.
+MAX_LANDMARKS = 12
+
 
 class CalibrationModel:
     """
@@ -24,27 +27,76 @@ class CalibrationModel:
         image_path (str): The absolute path to the loaded image file.
         image (PIL.Image.Image): The processed image, ready for display.
         image_tk (ImageTk.PhotoImage): The tkinter-compatible version of the image.
+        csv_tk (ImageTk.PhotoImage): The tkinter-compatible image of the CSV points.
         landmarks_csv (list): A list of (x, y) tuples for landmarks on the CSV canvas.
         landmarks_image (list): A list of (x, y) tuples for landmarks on the image canvas.
         action_history (list): A log of the type of landmarks added ('image' or 'csv')
                                to support the undo functionality.
+        landmarks_image_array (np.ndarray): A preallocated (12, 2) array mirroring
+                                            landmarks_image in its first rows.
+        landmarks_csv_array (np.ndarray): A preallocated (12, 2) array mirroring
+                                          landmarks_csv in its first rows.
+        csv_fieldnames (list): The column names from the header of the loaded CSV file.
+        csv_rows (list): The rows of the loaded CSV file as lists of strings, kept so
+                         the file doesn't have to be parsed again when saving.
         scaled_csv_data (np.ndarray): The preprocessed and scaled CSV coordinates.
+        transformed_csv_data (np.ndarray): The scaled CSV coordinates mapped into
+                                           image space by the current calibration,
+                                           or None if not computed yet.
         calibration_results (dict): A dictionary to store the results from the
                                     affine transformation calculation.
+        affine_matrix_2x3 (np.ndarray): The top two rows of the calibrated affine
+                                        matrix, the part that maps 2D points.
+        overlay_image (PIL.Image.Image): The overlay rendered for the last calibration,
+                                         or None if the landmarks changed since.
         experiment_path (str): The path to the dedicated folder for the current session.
     """
 
+    # The model is read on every click, so its attributes are slots: a fixed
+    # layout without a per-instance __dict__, and a typo in an attribute name
+    # raises an AttributeError instead of silently creating a new attribute.
+    __slots__ = (
+        "csv_path",
+        "image_path",
+        "image",
+        "image_tk",
+        "csv_tk",
+        "csv_fieldnames",
+        "csv_rows",
+        "landmarks_csv",
+        "landmarks_image",
+        "action_history",
+        "landmarks_image_array",
+        "landmarks_csv_array",
+        "scaled_csv_data",
+        "transformed_csv_data",
+        "calibration_results",
+        "affine_matrix_2x3",
+        "overlay_image",
+        "experiment_path",
+    )
+
     def __init__(self):
         """Initializes the model with default empty values."""
         self.csv_path = None
         self.image_path = None
         self.image = None
         self.image_tk = None
+        self.csv_tk = None
+        self.csv_fieldnames = None
+        self.csv_rows = None
         self.landmarks_csv = []
         self.landmarks_image = []
         self.action_history = []
+        # The landmarks are also kept in fixed-size arrays, so the landmark pairs
+        # can be returned as array views instead of converting the lists each time.
+        self.landmarks_image_array = np.empty((MAX_LANDMARKS, 2), dtype=np.float64)
+        self.landmarks_csv_array = np.empty((MAX_LANDMARKS, 2), dtype=np.float64)
         self.scaled_csv_data = None
+        self.transformed_csv_data = None
         self.calibration_results = {}
+        self.affine_matrix_2x3 = None
+        self.overlay_image = None
         self.experiment_path = None
 
     def clear_landmarks(self):
@@ -52,6 +104,7 @@ class CalibrationModel:
         self.landmarks_csv = []
         self.landmarks_image = []
         self.action_history = []
+        self.overlay_image = None
 
     def add_image_landmark(self, point):
         """
@@ -64,11 +117,13 @@ class CalibrationModel:
             bool: True if the landmark was added, False if the maximum number
                   of landmarks (12) was already reached.
         """
-        # We limit the number of landmarks to 12 to keep the UI clean.
-        if len(self.landmarks_image) < 12:
+        if len(self.landmarks_image) < MAX_LANDMARKS:
+            self.landmarks_image_array[len(self.landmarks_image)] = point
             self.landmarks_image.append(point)
             # Record this action so we can undo it if requested.
             self.action_history.append("image")
+            # The last overlay no longer shows the current landmarks.
+            self.overlay_image = None
             return True
         return False
 
@@ -83,10 +138,12 @@ class CalibrationModel:
             bool: True if the landmark was added, False if the maximum number
                   of landmarks (12) was already reached.
         """
-        if len(self.landmarks_csv) < 12:
+        if len(self.landmarks_csv) < MAX_LANDMARKS:
+            self.landmarks_csv_array[len(self.landmarks_csv)] = point
             self.landmarks_csv.append(point)
             # Record this action for the undo history.
             self.action_history.append("csv")
+            self.overlay_image = None
             return True
         return False
 
@@ -103,6 +160,7 @@ class CalibrationModel:
 
         # Get the last action performed.
         last_action = self.action_history.pop()
+        self.overlay_image = None
         # Remove the last point from the appropriate list.
         if last_action == "image" and self.landmarks_image:
             self.landmarks_image.pop()
@@ -121,13 +179,14 @@ class CalibrationModel:
         return 3 pairs of points.
 
         Returns:
-            tuple: A tuple containing two NumPy arrays:
+            tuple: A tuple containing two float64 NumPy arrays of shape (N, 2):
                 - The first array contains the image landmark coordinates.
                 - The second array contains the corresponding CSV landmark coordinates.
+                Both are views of the model's landmark arrays and must not be modified.
         """
         # The number of complete pairs is the minimum of the two list lengths.
         num_pairs = min(len(self.landmarks_image), len(self.landmarks_csv))
-        # Convert the lists of tuples to NumPy arrays for numerical computation.
-        image_points = np.array(self.landmarks_image[:num_pairs])
-        csv_points = np.array(self.landmarks_csv[:num_pairs])
+        # The arrays already hold the landmarks in order, so no conversion is needed.
+        image_points = self.landmarks_image_array[:num_pairs]
+        csv_points = self.landmarks_csv_array[:num_pairs]
         return image_points, csv_points
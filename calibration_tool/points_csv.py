@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+This module reads and writes the CSV files of points used by the calibration tool.
+
+The CSV files come from other tools and can contain any number of extra
+columns (including free text) next to the `pos_x` and `pos_y` coordinates.
+All columns are parsed with the `csv` module, so quoted fields and characters
+like '#' in text columns are handled the same way as in any spreadsheet.
+"""
+import csv
+
+import numpy as np
+
+
+def read_points_csv(path):
+    """
+    Reads a CSV file of points, keeping all of its columns.
+
+    Args:
+        path (str): The path to the CSV file. Its header must contain the
+            `pos_x` and `pos_y` columns.
+
+    Returns:
+        tuple: A tuple containing:
+            - list: The column names from the header.
+            - list: The data rows, each a list of strings. Blank lines are
+                    skipped, like `csv.DictReader` does.
+            - np.ndarray: The (N, 2) float array of the `pos_x`, `pos_y` values,
+                          in the same order as the data rows.
+    """
+    with open(path, newline="", encoding="utf-8") as infile:
+        # csv.reader returns an empty list for a blank line. Those are dropped
+        # here, before the coordinates are parsed, so every kept row is a point.
+        rows = [row for row in csv.reader(infile) if row]
+    fieldnames, data_rows = rows[0], rows[1:]
+
+    # The coordinates are taken from the same parsed rows that are kept for
+    # writing the file back, so both always describe the same points.
+    ix = fieldnames.index("pos_x")
+    iy = fieldnames.index("pos_y")
+    points = np.array(
+        [[float(row[ix]), float(row[iy])] for row in data_rows], dtype=np.float64
+    ).reshape(-1, 2)
+
+    return fieldnames, data_rows, points
+
+
+def write_calibrated_csv(path, fieldnames, rows, transformed_points):
+    """
+    Writes the original CSV rows with the transformed coordinates appended.
+
+    Args:
+        path (str): The path of the CSV file to write.
+        fieldnames (list): The column names of the original CSV file.
+        rows (list): The original data rows, as returned by `read_points_csv`.
+        transformed_points (np.ndarray): The (N, 2) transformed coordinates,
+            one per data row and in the same order.
+
+    Raises:
+        ValueError: If the number of points doesn't match the number of rows.
+    """
+    if len(rows) != len(transformed_points):
+        raise ValueError(
+            f"Got {len(transformed_points)} transformed points "
+            f"for {len(rows)} CSV rows."
+        )
+    # Plain Python floats for the new columns (keep row order).
+    x_transformed = transformed_points[:, 0].tolist()
+    y_transformed = transformed_points[:, 1].tolist()
+
+    # Rows are written positionally with csv.writer, through a large buffer to
+    # keep the number of write calls low. A row with fewer fields than the
+    # header is padded with empty fields (as `csv.DictWriter` would write its
+    # missing values), so the new values always land in the new columns.
+    n_columns = len(fieldnames)
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(fieldnames + ["x_transformed", "y_transformed"])
+        writer.writerows(
+            row + [""] * (n_columns - len(row)) + [x, y]
+            for row, x, y in zip(rows, x_transformed, y_transformed)
+        )
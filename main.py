@@ -4,9 +4,6 @@ from datetime import datetime
 import os
 import argparse
 import sys
-from calibration_tool.app import App
-from calibration_tool.model import CalibrationModel
-from calibration_tool.controller import Controller
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 EXPERIMENTS_ROOT = os.path.join(PROJECT_ROOT, "experiments")
@@ -70,6 +67,13 @@ if __name__ == "__main__":
 
         os.makedirs(experiment_path, exist_ok=True)
 
+        # The application modules pull in NumPy, SciPy and Pillow. They are only
+        # imported once an experiment is confirmed, so the name prompt appears
+        # without waiting for them (and nothing is imported if it is cancelled).
+        from calibration_tool.app import App
+        from calibration_tool.model import CalibrationModel
+        from calibration_tool.controller import Controller
+
         root.deiconify()
         root.title("2D Affine Transformation Calibration Tool")
 
@@ -1,6 +1,6 @@
 import numpy as np
 import pytest
-from calibration_tool.analysis import calculate_affine_transform
+from calibration_tool.analysis import AffineSolver, calculate_affine_transform
 
 
 def test_calculate_affine_transform_success():
@@ -27,3 +27,50 @@ def test_calculate_affine_transform_insufficient_points():
 
     with pytest.raises(ValueError, match="At least 3 landmark pairs are required"):
         calculate_affine_transform(image_points, csv_points)
+
+
+def test_calculate_affine_transform_error_statistics():
+    # A noisy fit, so the errors are non-zero and differ between pairs.
+    image_points = np.array([[0, 0], [10, 0], [0, 10], [30, 40], [25, 5]])
+    csv_points = np.array([[1, 0], [21, 1], [1, 11], [67, 41], [52, 6]])
+
+    results = calculate_affine_transform(image_points, csv_points)
+
+    errors = np.asarray(results["errors"])
+    assert errors.shape == (5,)
+    np.testing.assert_allclose(results["min_error"], errors.min())
+    np.testing.assert_allclose(results["max_error"], errors.max())
+    np.testing.assert_allclose(results["mean_error"], errors.mean())
+    np.testing.assert_allclose(results["std_error"], errors.std())
+
+
+def test_affine_solver_matches_direct_calculation():
+    source_points = [(0, 0), (10, 0), (0, 10), (30, 40), (25, 5)]
+    target_points = [(1, 0), (21, 1), (1, 11), (67, 41), (52, 6)]
+
+    solver = AffineSolver()
+    for p, q in zip(source_points, target_points):
+        solver.add_point(p, q)
+    # Adding and then removing a pair must leave the fit unchanged.
+    solver.add_point((100, 100), (0, 0))
+    solver.remove_point()
+
+    results = solver.solve()
+    expected = calculate_affine_transform(
+        np.array(source_points), np.array(target_points)
+    )
+
+    assert len(solver) == 5
+    np.testing.assert_allclose(
+        results["affine_matrix"], expected["affine_matrix"], atol=1e-9
+    )
+    np.testing.assert_allclose(results["errors"], expected["errors"], atol=1e-9)
+
+
+def test_affine_solver_insufficient_points():
+    solver = AffineSolver()
+    solver.add_point((10, 10), (30, 40))
+    solver.add_point((20, 10), (50, 40))
+
+    with pytest.raises(ValueError, match="At least 3 landmark pairs are required"):
+        solver.solve()
@@ -1,7 +1,14 @@
 import numpy as np
 import pytest
-from PIL import Image
-from calibration_tool.image import auto_crop, remove_background, pad_image_to_center
+from PIL import Image, ImageDraw
+from calibration_tool.image import (
+    auto_crop,
+    content_bbox,
+    draw_disks,
+    generate_mosaic,
+    pad_image_to_center,
+    remove_background,
+)
 
 
 @pytest.fixture
@@ -54,3 +61,88 @@ def test_pad_image_to_center():
     assert padded_img[15 + 9, 5 + 19, 0] == 50
     # Check a background pixel
     assert padded_img[0, 0, 0] != 50
+
+
+def test_draw_disks_matches_pillow_ellipse():
+    centers = np.array([[10.0, 10.0], [25.6, 4.3], [31.2, 30.9]])
+
+    expected = Image.new("L", (40, 40), 255)
+    draw = ImageDraw.Draw(expected)
+    for x, y in centers:
+        draw.ellipse((x - 2, y - 2, x + 2, y + 2), fill=0)
+
+    img = np.full((40, 40), 255, dtype=np.uint8)
+    draw_disks(img, centers, radius=2, color=0)
+
+    np.testing.assert_array_equal(img, np.asarray(expected))
+
+
+def test_draw_disks_clips_at_borders():
+    img = np.full((40, 40), 255, dtype=np.uint8)
+    draw_disks(img, np.array([[0.0, 20.0]]), radius=2, color=0)
+
+    # Half of the disk is drawn, and nothing wraps around to the other side.
+    assert img[20, 0] == 0
+    assert img[20, 2] == 0
+    assert np.all(img[:, 37:] == 255)
+
+    # Centers on, across and outside every border, including negative and
+    # fractional ones, where Pillow truncates the box toward zero.
+    centers = np.array(
+        [
+            [-1.5, 10.0],
+            [0.5, -0.7],
+            [1.3, 1.8],
+            [-2.5, -2.5],
+            [-3.2, 20.4],
+            [20.6, -1.1],
+            [39.5, 15.2],
+            [38.7, 39.9],
+            [41.0, 20.0],
+            [20.0, 42.3],
+            [-10.0, -10.0],
+        ]
+    )
+    expected = Image.new("L", (40, 40), 255)
+    draw = ImageDraw.Draw(expected)
+    for x, y in centers:
+        draw.ellipse((x - 2, y - 2, x + 2, y + 2), fill=0)
+
+    img = np.full((40, 40), 255, dtype=np.uint8)
+    draw_disks(img, centers, radius=2, color=0)
+
+    np.testing.assert_array_equal(img, np.asarray(expected))
+
+
+def test_content_bbox(sample_image_array):
+    # Pillow's (left, upper, right, lower) convention, right/lower exclusive.
+    assert content_bbox(sample_image_array) == (35, 40, 65, 60)
+
+
+def test_generate_mosaic_layout():
+    # Six uniform 4x4 tiles, tile i has the color i + 1.
+    tiles = [np.full((4, 4, 3), i + 1, dtype=np.uint8) for i in range(6)]
+
+    # More columns than rows: the grid is filled row by row.
+    mosaic = generate_mosaic(
+        list(tiles),
+        2,
+        3,
+        auto_bbox=False,
+        auto_border=False,
+        scaling_method="pad_to_max",
+    )
+    assert mosaic.shape == (8, 12, 3)
+    np.testing.assert_array_equal(mosaic[::4, ::4, 0], [[1, 2, 3], [4, 5, 6]])
+
+    # More rows than columns: the grid is filled column by column.
+    mosaic = generate_mosaic(
+        list(tiles),
+        3,
+        2,
+        auto_bbox=False,
+        auto_border=False,
+        scaling_method="pad_to_max",
+    )
+    assert mosaic.shape == (12, 8, 3)
+    np.testing.assert_array_equal(mosaic[::4, ::4, 0], [[1, 4], [2, 5], [3, 6]])
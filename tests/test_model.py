@@ -52,7 +52,36 @@ def test_get_landmark_pairs(model):
 
     img_pts, csv_pts = model.get_landmark_pairs()
 
+    assert img_pts.dtype == np.float64
+    assert csv_pts.dtype == np.float64
     assert img_pts.shape == (2, 2)
     assert csv_pts.shape == (2, 2)
-    np.testing.assert_array_equal(img_pts, np.array([[1, 1], [2, 2]]))
-    np.testing.assert_array_equal(csv_pts, np.array([[10, 10], [20, 20]]))
+    assert img_pts.tolist() == [[1, 1], [2, 2]]
+    assert csv_pts.tolist() == [[10, 10], [20, 20]]
+
+
+def test_landmark_changes_clear_overlay(model):
+    model.overlay_image = object()
+    model.add_image_landmark((10, 20))
+    assert model.overlay_image is None
+
+    model.overlay_image = object()
+    model.undo_last_landmark()
+    assert model.overlay_image is None
+
+
+def test_landmark_pairs_after_undo(model):
+    model.add_image_landmark((1, 1))
+    model.add_csv_landmark((10, 10))
+    model.undo_last_landmark()
+    model.add_csv_landmark((30, 30))
+
+    img_pts, csv_pts = model.get_landmark_pairs()
+
+    np.testing.assert_array_equal(img_pts, np.array([[1, 1]]))
+    np.testing.assert_array_equal(csv_pts, np.array([[30, 30]]))
+
+    model.clear_landmarks()
+    img_pts, csv_pts = model.get_landmark_pairs()
+    assert img_pts.shape == (0, 2)
+    assert csv_pts.shape == (0, 2)
@@ -0,0 +1,85 @@
+import csv
+
+import numpy as np
+import pytest
+from calibration_tool.points_csv import read_points_csv, write_calibrated_csv
+
+
+def test_read_points_csv_keeps_text_columns(tmp_path):
+    csv_path = tmp_path / "points.csv"
+    csv_path.write_text(
+        'name,pos_x,note,pos_y\n'
+        'a,1.5,"first, with a comma",2.5\n'
+        'b,3.0,tag #2,4.0\n',
+        encoding="utf-8",
+    )
+
+    fieldnames, rows, points = read_points_csv(csv_path)
+
+    assert fieldnames == ["name", "pos_x", "note", "pos_y"]
+    assert rows == [
+        ["a", "1.5", "first, with a comma", "2.5"],
+        ["b", "3.0", "tag #2", "4.0"],
+    ]
+    assert points.dtype == np.float64
+    assert points.tolist() == [[1.5, 2.5], [3.0, 4.0]]
+
+
+def test_blank_line_keeps_rows_and_points_aligned(tmp_path):
+    csv_path = tmp_path / "points.csv"
+    csv_path.write_text(
+        "name,pos_x,pos_y\n"
+        "a,1,2\n"
+        "\n"
+        "b,3,4\n"
+        "c,5,6\n",
+        encoding="utf-8",
+    )
+
+    fieldnames, rows, points = read_points_csv(csv_path)
+    assert len(rows) == len(points) == 3
+
+    out_path = tmp_path / "calibrated.csv"
+    write_calibrated_csv(out_path, fieldnames, rows, points * 10)
+
+    with open(out_path, newline="", encoding="utf-8") as f:
+        written = list(csv.reader(f))
+    assert written == [
+        ["name", "pos_x", "pos_y", "x_transformed", "y_transformed"],
+        ["a", "1", "2", "10.0", "20.0"],
+        ["b", "3", "4", "30.0", "40.0"],
+        ["c", "5", "6", "50.0", "60.0"],
+    ]
+
+
+def test_short_row_is_padded_to_the_header(tmp_path):
+    csv_path = tmp_path / "points.csv"
+    csv_path.write_text(
+        "pos_x,pos_y,note\n"
+        "1,2\n"
+        "3,4,full\n",
+        encoding="utf-8",
+    )
+
+    fieldnames, rows, points = read_points_csv(csv_path)
+
+    out_path = tmp_path / "calibrated.csv"
+    write_calibrated_csv(out_path, fieldnames, rows, points * 10)
+
+    with open(out_path, newline="", encoding="utf-8") as f:
+        written = list(csv.reader(f))
+    assert written == [
+        ["pos_x", "pos_y", "note", "x_transformed", "y_transformed"],
+        ["1", "2", "", "10.0", "20.0"],
+        ["3", "4", "full", "30.0", "40.0"],
+    ]
+
+
+def test_write_calibrated_csv_rejects_mismatched_points(tmp_path):
+    with pytest.raises(ValueError):
+        write_calibrated_csv(
+            tmp_path / "calibrated.csv",
+            ["pos_x", "pos_y"],
+            [["1", "2"]],
+            np.zeros((2, 2)),
+        )